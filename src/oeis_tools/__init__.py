@@ -21,9 +21,17 @@ For more details, refer to the documentation in individual modules.
 """
 
 from .__version__ import __version__
+from ._http import close_session
 from .bfile import BFile
 from .sequence import Sequence
-from .utils import OEIS_URL, check_id, oeis_bfile, oeis_keyword_description, oeis_url
+from .utils import (
+    OEIS_KEYWORD_TAGS,
+    OEIS_URL,
+    check_id,
+    oeis_bfile,
+    oeis_keyword_description,
+    oeis_url,
+)
 
 __all__ = [
     "__version__",
@@ -31,7 +39,9 @@ __all__ = [
     "oeis_bfile",
     "oeis_url",
     "oeis_keyword_description",
+    "close_session",
     "OEIS_URL",
+    "OEIS_KEYWORD_TAGS",
     "BFile",
     "Sequence",
 ]
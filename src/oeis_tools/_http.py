@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 EnriquePH
+
+"""
+Shared HTTP session used for all requests to oeis.org.
+
+Every ``Sequence`` and ``BFile`` fetch goes through the same
+``requests.Session`` so that TCP/TLS connections to oeis.org are kept alive
+and reused from the urllib3 connection pool instead of being re-established
+for each request.
+
+Setting ``OEIS_TOOLS_CACHE=1`` (or ``OEIS_TOOLS_CACHE_DIR`` to a directory)
+enables an on-disk response cache shared between processes. Entries younger
+than ``OEIS_TOOLS_CACHE_TTL`` seconds (default 7 days) are served without any
+request. Older ones are revalidated with ``If-None-Match`` /
+``If-Modified-Since``, so an unchanged resource costs a ``304 Not Modified``
+round trip instead of a full download.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .__version__ import __version__
+
+CACHE_ENV = "OEIS_TOOLS_CACHE"
+CACHE_DIR_ENV = "OEIS_TOOLS_CACHE_DIR"
+CACHE_TTL_ENV = "OEIS_TOOLS_CACHE_TTL"
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Read size for streamed bodies. requests defaults to 512 bytes, which makes
+# per-chunk overhead dominate line parsing on large b-files.
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = (
+    f"oeis-tools/{__version__} (+https://github.com/oeistools/oeis-tools)"
+)
+
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.2),
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+
+def close_session() -> None:
+    """
+    Close the pooled connections held by the shared OEIS session.
+
+    The session stays usable afterwards; the next request simply opens a new
+    connection.
+    """
+    SESSION.close()
+
+
+def _cache_dir() -> Path | None:
+    """Return the configured cache directory, or None when caching is off."""
+    directory = os.environ.get(CACHE_DIR_ENV)
+    if directory:
+        return Path(directory).expanduser()
+    if os.environ.get(CACHE_ENV) != "1":
+        return None
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "oeis_tools"
+
+
+def _cache_ttl() -> float:
+    """Return how many seconds a cached body is used without revalidation."""
+    try:
+        return float(os.environ.get(CACHE_TTL_ENV, DEFAULT_CACHE_TTL))
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+
+def _read_fresh(body_path: Path) -> bytes | None:
+    """Return a cached body still within its TTL, or None."""
+    try:
+        if time.time() - body_path.stat().st_mtime < _cache_ttl():
+            return body_path.read_bytes()
+    except OSError:
+        pass
+    return None
+
+
+def _cache_paths(directory: Path, url: str) -> tuple[Path, Path]:
+    """Return the (body, metadata) file paths used to cache ``url``."""
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return directory / f"{key}.body", directory / f"{key}.json"
+
+
+def _validators(meta_path: Path) -> dict[str, str]:
+    """Build conditional request headers from a cached metadata file."""
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write ``data`` to ``path`` so readers never see a partial file.
+
+    The bytes go to a temporary file in the same directory, which then
+    atomically replaces ``path``. A concurrent writer or a crash mid-write
+    leaves either the previous file or the complete new one.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _store(
+    body_path: Path, meta_path: Path, response: requests.Response, content: bytes
+) -> None:
+    """Write a response body and its validators to the cache, best effort."""
+    meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    if not (meta["etag"] or meta["last_modified"] or _cache_ttl() > 0):
+        return
+    try:
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(body_path, content)
+        _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+    except OSError:
+        pass
+
+
+def get_content(url: str, timeout: float) -> bytes:
+    """
+    Download ``url`` and return the response body.
+
+    When the disk cache is enabled, a cached copy within its TTL is returned
+    directly; an older one is revalidated against the server and reused on
+    ``304 Not Modified``.
+
+    Args:
+        url (str): URL to download.
+        timeout (float): Request timeout in seconds.
+
+    Returns:
+        bytes: The (decompressed) response body.
+
+    Raises:
+        requests.RequestException: If the request fails.
+    """
+    directory = _cache_dir()
+    if directory is None:
+        response = SESSION.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+
+    body_path, meta_path = _cache_paths(directory, url)
+    content = _read_fresh(body_path)
+    if content is not None:
+        return content
+
+    headers = _validators(meta_path) if body_path.is_file() else {}
+    response = SESSION.get(url, timeout=timeout, headers=headers)
+    if response.status_code == 304 and headers:
+        try:
+            content = body_path.read_bytes()
+            # Restart the TTL window for the revalidated copy.
+            os.utime(body_path)
+            return content
+        except OSError:
+            response = SESSION.get(url, timeout=timeout)
+    response.raise_for_status()
+    content = response.content
+    _store(body_path, meta_path, response, content)
+    return content
+
+
+def iter_content_lines(url: str, timeout: float) -> Iterator[bytes]:
+    """
+    Yield the lines of ``url`` as raw bytes.
+
+    Without the disk cache the body is streamed, so parsing overlaps with the
+    download; with it, the (possibly cached) body is split once downloaded.
+
+    Args:
+        url (str): URL to download.
+        timeout (float): Request timeout in seconds.
+
+    Yields:
+        bytes: One line of the response body, without its line terminator.
+
+    Raises:
+        requests.RequestException: If the request fails.
+    """
+    if _cache_dir() is not None:
+        yield from get_content(url, timeout).splitlines()
+        return
+
+    with SESSION.get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        yield from response.iter_lines(chunk_size=_STREAM_CHUNK_SIZE)
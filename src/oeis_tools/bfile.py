@@ -23,12 +23,31 @@ from __future__ import annotations
 
 import math
 import sys
+from array import array
 from pathlib import Path
 from typing import Any
 
 import requests
 
-from .utils import oeis_bfile, oeis_url
+from ._http import iter_content_lines
+from .utils import _oeis_bfile_unchecked, oeis_bfile, oeis_url
+
+
+def _int_column(tokens: list[bytes]) -> array | list[int]:
+    """
+    Convert a b-file column of tokens to integers.
+
+    Values are packed into an ``array('q')`` (8 bytes per value instead of a
+    boxed Python int plus a list slot) when they all fit in a signed 64-bit
+    integer, and kept as a ``list[int]`` otherwise.
+
+    Raises:
+        ValueError: If a token is not an integer.
+    """
+    try:
+        return array("q", map(int, tokens))
+    except OverflowError:
+        return list(map(int, tokens))
 
 
 def create_bfile(
@@ -68,6 +87,31 @@ def create_bfile(
     return str(file_path)
 
 
+def _exceeds_float_range(values: array | list[int]) -> bool:
+    """
+    Return True when some value cannot be represented as a float.
+
+    ``array('q')`` values always fit, so the scan is skipped for them; for
+    lists, ``max``/``min`` run the comparison loop in C.
+    """
+    if isinstance(values, array) or not values:
+        return False
+    return max(values) > sys.float_info.max or min(values) < -sys.float_info.max
+
+
+def _signed_log10(value: int) -> float:
+    """
+    Return ``sign(value) * log10(|value|)``, with 0 mapped to 0.0.
+
+    ``math.log10`` accepts integers of any size without converting them to
+    float first, so values beyond the float range need no special handling.
+    """
+    if not value:
+        return 0.0
+    magnitude = math.log10(abs(value))
+    return magnitude if value > 0 else -magnitude
+
+
 class BFile:
     """
     Represents an OEIS b-file and provides access to its numeric data.
@@ -80,44 +124,59 @@ class BFile:
         oeis_id (str): The OEIS identifier (e.g., 'A000045').
         filename (str): The b-file name (e.g., 'bA000045.txt').
         url (str): The URL where the b-file can be downloaded.
-        bfile_data (list[int] or None): Parsed sequence values from the
+        data (array or list[int] or None): Parsed sequence values from the
             b-file, or None if the b-file could not be retrieved or parsed.
+            Values are stored in an ``array('q')`` when they all fit in a
+            signed 64-bit integer and in a ``list[int]`` otherwise.
+        indices (array or list[int] or None): Parsed b-file indices, stored
+            the same way as ``data``.
     """
 
+    __slots__ = ("oeis_id", "filename", "url", "indices", "data")
+
     def __init__(self, oeis_id: str) -> None:
         self.oeis_id = oeis_id
-        self.filename = oeis_bfile(oeis_id)
+        # oeis_url validates the ID, so the filename can skip a second check.
         self.url = oeis_url(oeis_id, fmt="bfile")
+        self.filename = _oeis_bfile_unchecked(oeis_id)
         self.indices = None
         self.data = self.fetch_bfile_data()
 
-    def fetch_bfile_data(self) -> list[int] | None:
+    def fetch_bfile_data(self) -> array | list[int] | None:
         """
-        Fetch and parse the b-file into a list of integers.
+        Fetch and parse the b-file into a sequence of integers.
 
         Returns:
-            list[int] or None: Parsed sequence values, or None on failure.
+            array or list[int] or None: Parsed sequence values, or None on
+            failure.
         """
+        index_tokens = []
+        value_tokens = []
         try:
-            response = requests.get(self.url, timeout=10)
-            response.raise_for_status()
+            # Lines are streamed so long b-files are parsed as they arrive
+            # instead of being buffered and decoded as one large string first.
+            for line in iter_content_lines(self.url, timeout=10):
+                # format: n a(n). Work on the raw ASCII bytes: split() also
+                # drops surrounding whitespace and int() accepts bytes.
+                fields = line.split(None, 2)
+                if not fields or fields[0].startswith(b"#"):
+                    continue
+                if len(fields) < 2:
+                    self.indices = None
+                    return None
+                index_tokens.append(fields[0])
+                value_tokens.append(fields[1])
         except requests.RequestException:
             return None
 
-        indices = []
-        data = []
-        for line in response.text.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            try:
-                # format: n a(n)
-                index, value, *_ = line.split()
-                indices.append(int(index))
-                data.append(int(value))
-            except (ValueError, IndexError):
-                self.indices = None
-                return None
+        try:
+            # Convert each column in one C-level pass instead of calling int()
+            # from the interpreter loop for every line.
+            indices = _int_column(index_tokens)
+            data = _int_column(value_tokens)
+        except ValueError:
+            self.indices = None
+            return None
 
         self.indices = indices
         return data
@@ -140,22 +199,25 @@ class BFile:
         """
         return self.url
 
-    def get_bfile_data(self) -> list[int] | None:
+    def get_bfile_data(self) -> array | list[int] | None:
         """
         Return the numeric data parsed from the OEIS b-file.
 
         Returns:
-            list[int] or None: A list of sequence values extracted from the
+            array or list[int] or None: Sequence values extracted from the
             b-file, or None if the b-file could not be fetched or parsed.
+            Values are an ``array('q')`` when they all fit in a signed 64-bit
+            integer and a ``list[int]`` otherwise.
         """
         return self.data
 
-    def get_bfile_indices(self) -> list[int] | None:
+    def get_bfile_indices(self) -> array | list[int] | None:
         """
         Return index values parsed from the OEIS b-file first column.
 
         Returns:
-            list[int] or None: A list of b-file indices, or None when parsing failed.
+            array or list[int] or None: b-file indices, stored like the data
+            values, or None when parsing failed.
         """
         return self.indices
 
@@ -232,34 +294,11 @@ class BFile:
         else:
             x_values = range(len(plot_values))
 
-        use_log_magnitude = any(
-            abs(value) > sys.float_info.max for value in plot_values
-        )
+        use_log_magnitude = _exceeds_float_range(plot_values)
 
         if use_log_magnitude:
             # Matplotlib stores data as float; extremely large integers overflow.
-            log10_2 = math.log10(2.0)
-
-            def safe_log10_abs_int(value):
-                absolute = abs(value)
-                if absolute <= sys.float_info.max:
-                    return math.log10(absolute)
-
-                # Compute log10(n) using bit-length scaling to avoid float overflow.
-                shift = max(absolute.bit_length() - 53, 0)
-                mantissa = absolute >> shift
-                return math.log10(mantissa) + shift * log10_2
-
-            y_values = [
-                0.0
-                if value == 0
-                else (
-                    -safe_log10_abs_int(value)
-                    if value < 0
-                    else safe_log10_abs_int(value)
-                )
-                for value in plot_values
-            ]
+            y_values = list(map(_signed_log10, plot_values))
             if plot_style_normalized == "scatter":
                 ax.scatter(x_values, y_values, **plot_kwargs)
             else:
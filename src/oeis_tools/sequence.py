@@ -5,20 +5,108 @@
 
 from __future__ import annotations
 
+import copy
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
-import requests
-
+from ._http import SESSION, get_content
 from .bfile import BFile
 from .utils import OEIS_URL, check_id, oeis_keyword_description, oeis_url
 
+try:
+    # Optional C parser for ISO 8601 timestamps (``pip install oeis-tools[fast]``).
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
+
+try:
+    # Optional faster JSON decoder that parses the raw response bytes directly.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Patterns used by the parsers below, compiled once at import time.
+_LINK_A_RE = re.compile(r'<a href="([^"]*)">(.*?)</a>')
+# Require non-alphanumeric boundaries so longer tokens such as "A0000451" or
+# "XA000045" are not cut into a bogus 6-digit ID.
+_XREF_RE = re.compile(r"(?<![A-Za-z0-9])A\d{6}(?!\d)")
+_INT_RE = re.compile(r"[-+]?\d+")
+_UNDERSCORE_RE = re.compile(r"^_+|_+$")
+_DATE_RE = re.compile(
+    r"\d{4}"
+    r"|[A-Za-z]{3,9}\.? \d{1,2},? \d{4}"
+    r"|\d{1,2} [A-Za-z]{3,9}\.? \d{4}"
+    r"|\d{4}-\d{2}-\d{2}"
+)
+
+# Relative OEIS links are made absolute with a plain substring replacement.
+_HREF_FROM = 'href="/'
+_HREF_TO = f'href="{OEIS_URL}/'
+
+# The OEIS search API returns at most 10 records per response.
+_BULK_CHUNK_SIZE = 10
+
+# Background pool for b-file downloads started by ``Sequence.prefetch_bfile``.
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="oeis-tools-bfile"
+)
+
+
+def _anchor_to_markdown(match: re.Match) -> str:
+    """Render one ``_LINK_A_RE`` match as a Markdown link with an absolute URL."""
+    url, text = match.groups()
+    if url.startswith("/"):
+        url = OEIS_URL + url
+    return f"[{text}]({url})"
+
+
+def _split_csv(raw) -> list[str]:
+    """
+    Split a comma-separated OEIS field into stripped, non-empty tokens.
+
+    Args:
+        raw (str or list): Raw field value; list items are used as tokens.
+
+    Returns:
+        list[str]: The tokens, or an empty list for any other input type.
+    """
+    if isinstance(raw, str):
+        tokens = raw.split(",")
+    elif isinstance(raw, list):
+        tokens = map(str, raw)
+    else:
+        return []
+    return list(filter(None, map(str.strip, tokens)))
+
+
+@lru_cache(maxsize=1024)
+def _get_json_content(oeis_id: str) -> bytes:
+    """
+    Fetch the raw OEIS JSON response for a validated ID, cached per process.
+
+    Repeated lookups of the same ID reuse the downloaded body instead of
+    issuing another request. The immutable bytes are cached rather than the
+    decoded record, so every ``Sequence`` decodes its own ``json`` dict and
+    mutating one never leaks into another. Failed requests raise and are not
+    cached.
+
+    Raises:
+        requests.HTTPError: If the request fails.
+    """
+    return get_content(oeis_url(oeis_id, fmt="json"), timeout=10)
+
 
 class Sequence:
     """
     A class to represent an OEIS sequence, fetching data from the JSON API.
 
+    ``id``, ``json``, ``data``, ``data_raw``, ``name`` and ``revision`` are set
+    on construction; the other fields are parsed from ``json`` on first access.
+
     Attributes:
         id (str): The OEIS ID.
         json (dict): The JSON data fetched from OEIS for the sequence.
@@ -28,7 +116,7 @@ class Sequence:
         created (datetime or None): The creation time from the 'created' field.
         link (str): Formatted links from the 'link' field as printable text
             with hyperlinks.
-        BFile (BFile or None): The BFile object if available, else None.
+        bfile (BFile): The sequence's b-file, downloaded on first access.
         data (list[int]): Parsed integer terms from the 'data' field.
         data_raw (str): Raw sequence data string from OEIS JSON.
         name (str): The sequence name from the 'name' field.
@@ -47,6 +135,55 @@ class Sequence:
         revision (str): Revision information from the 'revision' field.
     """
 
+    # OEIS JSON fields holding lists of text lines, exposed as joined strings.
+    _LIST_FIELDS = (
+        "comment",
+        "reference",
+        "formula",
+        "example",
+        "maple",
+        "mathematica",
+        "program",
+        "xref",
+        "references",
+    )
+
+    # Fields parsed from ``json`` only when first read (see ``__getattr__``).
+    _LAZY_FIELDS = frozenset(
+        (
+            *_LIST_FIELDS,
+            "keyword",
+            "offset",
+            "author",
+            "m_id",
+            "n_id",
+            "time",
+            "created",
+            "link",
+        )
+    )
+
+    __slots__ = (
+        "id",
+        "json",
+        "data_raw",
+        "data",
+        "name",
+        *_LIST_FIELDS,
+        "keyword",
+        "offset",
+        "author",
+        "revision",
+        "m_id",
+        "n_id",
+        "time",
+        "created",
+        "link",
+        "_bfile",
+        "_bfile_future",
+        "_graph_png",
+    )
+
     def __init__(self, oeis_id: str) -> None:
         """
         Initialize the Sequence with the given OEIS ID.
@@ -61,90 +198,249 @@ class Sequence:
         if not check_id(oeis_id):
             raise ValueError(f"Invalid OEIS ID: {oeis_id}")
 
-        json_url = oeis_url(oeis_id, fmt="json")
-        response = requests.get(json_url, timeout=10)
-        response.raise_for_status()
-        self.json = response.json()[0]
+        self._populate(oeis_id, _json_loads(_get_json_content(oeis_id))[0])
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def get(cls, oeis_id: str) -> Sequence:
+        """
+        Return a shared ``Sequence`` for an OEIS ID, memoized per process.
+
+        Repeated calls with the same ID return the same object, skipping both
+        the request and the parsing. Constructing ``Sequence(oeis_id)``
+        directly gives a separate object with its own ``json`` record, decoded
+        from the same cached response; call ``clear_cache`` first to fetch
+        fresh data from OEIS.
+
+        Args:
+            oeis_id (str): The OEIS ID, e.g., 'A000001'.
+
+        Returns:
+            Sequence: The cached sequence object.
+
+        Raises:
+            ValueError: If the oeis_id is invalid.
+            requests.HTTPError: If the request fails.
+        """
+        return cls(oeis_id)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Forget the JSON responses and ``get`` objects cached in this process.
+
+        The next ``Sequence(oeis_id)`` or ``Sequence.get(oeis_id)`` downloads
+        the record again. The on-disk cache (``OEIS_TOOLS_CACHE``) is not
+        touched; its entries expire after ``OEIS_TOOLS_CACHE_TTL`` seconds.
+        """
+        _get_json_content.cache_clear()
+        cls.get.cache_clear()
+
+    @classmethod
+    def bulk_fetch(
+        cls, ids: list[str], max_workers: int = 16, prefetch_bfiles: bool = False
+    ) -> list[Sequence]:
+        """
+        Fetch several OEIS sequences with batched JSON search requests.
+
+        The OEIS search API returns up to 10 records per response, so IDs are
+        queried in groups of 10 (``id:A000045|id:A000040|...``) instead of
+        issuing one request per sequence. The groups are downloaded
+        concurrently on a thread pool.
+
+        Args:
+            ids (list[str]): OEIS IDs to fetch, e.g. ``["A000045", "A000040"]``.
+            max_workers (int): Maximum number of concurrent requests.
+            prefetch_bfiles (bool): If True, start every b-file download in
+                the background (see ``prefetch_bfile``) before returning.
+
+        Returns:
+            list[Sequence]: One sequence per requested ID, in the order given.
+
+        Raises:
+            ValueError: If an ID is invalid or no record is returned for it.
+            requests.HTTPError: If a request fails.
+        """
+        for oeis_id in ids:
+            if not check_id(oeis_id):
+                raise ValueError(f"Invalid OEIS ID: {oeis_id}")
+
+        unique_ids = list(dict.fromkeys(ids))
+        chunks = [
+            unique_ids[start : start + _BULK_CHUNK_SIZE]
+            for start in range(0, len(unique_ids), _BULK_CHUNK_SIZE)
+        ]
+        records = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for chunk_records in executor.map(cls._search_records, chunks):
+                for record in chunk_records:
+                    records[f"A{record['number']:06d}"] = record
+
+        sequences = []
+        populated = set()
+        for oeis_id in ids:
+            if oeis_id not in records:
+                raise ValueError(f"OEIS ID not found: {oeis_id}")
+            record = records[oeis_id]
+            if oeis_id in populated:
+                # A repeated ID gets its own copy so instances never share json.
+                record = copy.deepcopy(record)
+            populated.add(oeis_id)
+            sequence = cls.__new__(cls)
+            sequence._populate(oeis_id, record)
+            if prefetch_bfiles:
+                sequence.prefetch_bfile()
+            sequences.append(sequence)
+        return sequences
+
+    @staticmethod
+    def _search_records(ids: list[str]) -> list[dict]:
+        """
+        Return the OEIS JSON records for up to 10 IDs from one search request.
+
+        Args:
+            ids (list[str]): Validated OEIS IDs.
+
+        Returns:
+            list[dict]: Records found by OEIS, in the order OEIS returns them.
+        """
+        query = "|".join(f"id:{oeis_id}" for oeis_id in ids)
+        content = get_content(f"{OEIS_URL}/search?q={query}&fmt=json", timeout=10)
+        return _json_loads(content) or []
+
+    def _populate(self, oeis_id: str, data_json: dict) -> None:
+        """
+        Set sequence attributes from an OEIS JSON record.
+
+        Args:
+            oeis_id (str): The validated OEIS ID of the record.
+            data_json (dict): A single record from the OEIS JSON API.
+        """
+        self.json = data_json
         self.id = oeis_id
 
         # Add direct attributes from json
         self.data_raw = self.json.get("data", "")
         self.data = self._parse_data_values(self.data_raw)
         self.name = self.json.get("name", "")
-        comment_raw = self.json.get("comment", [])
-        self.comment = (
-            "\n".join(comment_raw) if isinstance(comment_raw, list) else comment_raw
-        )
-        reference_raw = self.json.get("reference", [])
-        self.reference = (
-            "\n".join(reference_raw)
-            if isinstance(reference_raw, list)
-            else reference_raw
-        )
-        formula_raw = self.json.get("formula", [])
-        self.formula = (
-            "\n".join(formula_raw) if isinstance(formula_raw, list) else formula_raw
-        )
-        example_raw = self.json.get("example", [])
-        self.example = (
-            "\n".join(example_raw) if isinstance(example_raw, list) else example_raw
-        )
-        maple_raw = self.json.get("maple", [])
-        self.maple = "\n".join(maple_raw) if isinstance(maple_raw, list) else maple_raw
-        mathematica_raw = self.json.get("mathematica", [])
-        self.mathematica = (
-            "\n".join(mathematica_raw)
-            if isinstance(mathematica_raw, list)
-            else mathematica_raw
-        )
-        program_raw = self.json.get("program", [])
-        self.program = (
-            "\n".join(program_raw) if isinstance(program_raw, list) else program_raw
-        )
-        xref_raw = self.json.get("xref", [])
-        self.xref = "\n".join(xref_raw) if isinstance(xref_raw, list) else xref_raw
-        self.keyword = self._parse_keywords(self.json.get("keyword", ""))
-        self.offset = self._parse_offset(self.json.get("offset", ""))
-        self.author = self._parse_authors(self.json.get("author", ""))
-        references_raw = self.json.get("references", [])
-        self.references = (
-            "\n".join(references_raw)
-            if isinstance(references_raw, list)
-            else references_raw
-        )
         self.revision = self.json.get("revision", "")
+        # The remaining text, metadata, date and link fields are parsed on
+        # first access (see ``__getattr__``).
+
+        # The b-file is only downloaded when first needed (see ``bfile``).
+        self._bfile = None
+        self._bfile_future = None
+        self._graph_png = None
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Parse a lazily loaded field from ``self.json`` on first access.
+
+        Only called when a slot is still unset, so once the parsed value is
+        stored, later reads are plain slot lookups.
+
+        Raises:
+            AttributeError: If ``name`` is not a lazily loaded field.
+        """
+        if name not in self._LAZY_FIELDS:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        value = self._parse_field(name)
+        setattr(self, name, value)
+        return value
+
+    def _parse_field(self, name: str) -> Any:
+        """Compute the value of one lazily loaded field from ``self.json``."""
+        data_json = self.json
+        if name in self._LIST_FIELDS:
+            # Text fields arrive as lists of lines; expose one joined string.
+            raw = data_json.get(name, [])
+            return "\n".join(raw) if type(raw) is list else raw
+        if name == "keyword":
+            return self._parse_keywords(data_json.get("keyword", ""))
+        if name == "offset":
+            return self._parse_offset(data_json.get("offset", ""))
+        if name == "author":
+            return self._parse_authors(data_json.get("author", ""))
+        if name in ("m_id", "n_id"):
+            # M and N IDs come from the 'id' field, e.g. "M0692 N0256".
+            id_str = data_json.get("id", "")
+            parts = id_str.split() if id_str else []
+            position = 0 if name == "m_id" else 1
+            return parts[position] if len(parts) > position else None
+        if name in ("time", "created"):
+            date_str = data_json.get(name)
+            return _parse_datetime(date_str) if date_str else None
+        if name == "link":
+            # Links become printable text with hyperlinks.
+            return "\n".join(map(self._format_link, data_json.get("link", [])))
+        raise AttributeError(f"no parser for lazy field {name!r}")
+
+    @property
+    def bfile(self) -> BFile:
+        """
+        The sequence's b-file, downloaded on first access.
 
-        # Parse M and N IDs from the 'id' field
-        id_str = self.json.get("id", "")
-        parts = id_str.split() if id_str else []
-        self.m_id = parts[0] if parts else None
-        self.n_id = parts[1] if len(parts) > 1 else None
-
-        # Parse time and created as datetime objects
-        time_str = self.json.get("time")
-        self.time = datetime.fromisoformat(time_str) if time_str else None
-        created_str = self.json.get("created")
-        self.created = datetime.fromisoformat(created_str) if created_str else None
-
-        # Parse links as formatted text with hyperlinks
-        links = self.json.get("link", [])
-        formatted_links = []
-        for link in links:
-            # Parse HTML <a href="url">text</a> and convert to Markdown [text](url)
-            match = re.search(r'<a href="([^"]*)">(.*?)</a>', link)
-            if match:
-                url, text = match.groups()
-                if url.startswith("/"):
-                    url = OEIS_URL + url
-                formatted_links.append(f"[{text}]({url})")
+        Returns:
+            BFile: The b-file for this sequence. Its data is ``None`` when the
+            b-file could not be fetched or parsed.
+        """
+        if self._bfile is None:
+            if self._bfile_future is not None:
+                self._bfile = self._bfile_future.result()
+                self._bfile_future = None
             else:
-                # If no <a>, just add the text, but replace relative URLs
-                formatted_link = re.sub(r'href="/', f'href="{OEIS_URL}/', link)
-                formatted_links.append(formatted_link)
-        self.link = "\n".join(formatted_links) if formatted_links else ""
+                self._bfile = BFile(self.id)
+        return self._bfile
+
+    @bfile.setter
+    def bfile(self, value: BFile) -> None:
+        self._bfile = value
+        self._bfile_future = None
+
+    def prefetch_bfile(self) -> None:
+        """
+        Start downloading the b-file in the background.
+
+        The download runs on a shared thread pool; accessing ``bfile`` later
+        waits for it instead of starting a new request. Does nothing when the
+        b-file is already loaded or being fetched.
+        """
+        if self._bfile is None and self._bfile_future is None:
+            self._bfile_future = _PREFETCH_EXECUTOR.submit(BFile, self.id)
 
-        # Fetch BFile if content if b-file link is present
-        self.bfile = BFile(self.id)
+    def __getstate__(self) -> dict:
+        """
+        Return the set slots for pickling.
+
+        A pending ``prefetch_bfile`` future cannot be pickled: a finished
+        download is stored as ``bfile``, and one still running is dropped, so
+        the unpickled copy fetches its b-file again on first access.
+        """
+        state = {}
+        for name in self.__slots__:
+            try:
+                # object.__getattribute__ skips __getattr__, so unparsed lazy
+                # fields stay unset instead of being parsed just to pickle them.
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+        future = state.pop("_bfile_future", None)
+        if (
+            future is not None
+            and future.done()
+            and not future.cancelled()
+            and future.exception() is None
+        ):
+            state["_bfile"] = future.result()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the slots saved by ``__getstate__``."""
+        self._bfile_future = None
+        for name, value in state.items():
+            setattr(self, name, value)
 
     def get_bfile_info(self) -> dict:
         """
@@ -185,8 +481,8 @@ class Sequence:
             list[str]: Unique OEIS IDs (e.g. ``A000045``) in first-seen order.
         """
         xref_text = self.xref or ""
-        ids = re.findall(r"A\d{6}", xref_text)
-        return list(dict.fromkeys(ids))
+        # dict.fromkeys dedupes in C; it beats a Python set-guarded loop.
+        return list(dict.fromkeys(_XREF_RE.findall(xref_text)))
 
     def get_graph_png(
         self, *, timeout: int | float = 10, use_cache: bool = True
@@ -204,11 +500,11 @@ class Sequence:
         Raises:
             requests.HTTPError: When the OEIS request fails.
         """
-        if use_cache and getattr(self, "_graph_png", None) is not None:
+        if use_cache and self._graph_png is not None:
             return self._graph_png
 
         url = oeis_url(self.id, fmt="graph")
-        response = requests.get(url, timeout=timeout)
+        response = SESSION.get(url, timeout=timeout)
         response.raise_for_status()
         png_bytes = response.content
         self._graph_png = png_bytes
@@ -251,21 +547,7 @@ class Sequence:
         Returns:
             list[int]: Values extracted from ``self.data``.
         """
-        data_raw = self.data
-        if isinstance(data_raw, list):
-            tokens = data_raw
-        elif isinstance(data_raw, str):
-            tokens = re.findall(r"[-+]?\d+", data_raw)
-        else:
-            return []
-
-        values = []
-        for token in tokens:
-            try:
-                values.append(int(token))
-            except (TypeError, ValueError):
-                continue
-        return values
+        return self._parse_data_values(self.data)
 
     @staticmethod
     def _parse_data_values(data_raw) -> list[int]:
@@ -280,11 +562,27 @@ class Sequence:
         """
         if isinstance(data_raw, list):
             tokens = data_raw
+            try:
+                return list(map(int, tokens))
+            except (TypeError, ValueError):
+                pass
         elif isinstance(data_raw, str):
-            tokens = re.findall(r"[-+]?\d+", data_raw)
+            # OEIS sends plain "1,1,2,3" strings: convert them in one C-level
+            # pass and only tokenize with the regex when that fails.
+            try:
+                return list(map(int, data_raw.split(",")))
+            except ValueError:
+                tokens = _INT_RE.findall(data_raw)
+            # Regex matches are digit runs, but int() still rejects ones past
+            # the interpreter's digit limit, so keep the per-token fallback.
+            try:
+                return list(map(int, tokens))
+            except ValueError:
+                pass
         else:
             return []
 
+        # Slow path: convert token by token, skipping the ones that fail.
         values = []
         for token in tokens:
             try:
@@ -355,20 +653,10 @@ class Sequence:
         Returns:
             list[str]: Cleaned author names.
         """
-        if isinstance(author_raw, list):
-            chunks = author_raw
-        elif isinstance(author_raw, str):
-            chunks = author_raw.split(",")
-        else:
-            return []
-
         authors = []
-        for chunk in chunks:
-            name = chunk.strip()
-            name = re.sub(r"^_+|_+$", "", name).strip()
-            if Sequence._is_date_token(name):
-                continue
-            if name:
+        for chunk in _split_csv(author_raw):
+            name = _UNDERSCORE_RE.sub("", chunk).strip()
+            if name and not Sequence._is_date_token(name):
                 authors.append(name)
         return authors
 
@@ -383,15 +671,7 @@ class Sequence:
         - ``Apr 28, 2012``
         - ``2012-04-28``
         """
-        if re.fullmatch(r"\d{4}", value):
-            return True
-
-        date_patterns = [
-            r"[A-Za-z]{3,9}\.? \d{1,2},? \d{4}",
-            r"\d{1,2} [A-Za-z]{3,9}\.? \d{4}",
-            r"\d{4}-\d{2}-\d{2}",
-        ]
-        return any(re.fullmatch(pattern, value) for pattern in date_patterns)
+        return _DATE_RE.fullmatch(value) is not None
 
     @staticmethod
     def _parse_offset(offset_raw) -> list[int]:
@@ -400,45 +680,39 @@ class Sequence:
 
         Typical OEIS values look like ``"0,2"`` and are returned as ``[0, 2]``.
         """
-        if isinstance(offset_raw, list):
-            tokens = offset_raw
-        elif isinstance(offset_raw, str):
-            tokens = offset_raw.split(",")
-        else:
-            return []
-
         offsets = []
-        for token in tokens:
-            value = str(token).strip()
-            if not value:
-                continue
-            try:
+        for value in _split_csv(offset_raw):
+            # A digit check rejects malformed tokens without raising and
+            # catching ValueError; isascii() keeps out non-ASCII digits.
+            digits = value[1:] if value[0] in "+-" else value
+            if digits.isascii() and digits.isdigit():
                 offsets.append(int(value))
-            except ValueError:
-                continue
         return offsets
 
+    @staticmethod
+    def _format_link(link: str) -> str:
+        """
+        Format one OEIS link entry as printable text with a hyperlink.
+
+        Every HTML ``<a href="url">text</a>`` anchor becomes Markdown
+        ``[text](url)`` and the text around it is kept; remaining relative
+        ``href="/..."`` URLs are made absolute.
+        """
+        # Entries without an anchor skip the regex after a substring test.
+        if '<a href="' in link:
+            link = _LINK_A_RE.sub(_anchor_to_markdown, link)
+        return link.replace(_HREF_FROM, _HREF_TO)
+
     @staticmethod
     def _parse_keywords(keyword_raw) -> list[str]:
         """
         Parse OEIS keyword field into a list of strings.
 
         Typical OEIS values look like ``"nonn,easy"`` and are returned as
-        ``["nonn", "easy"]``.
+        ``["nonn", "easy"]``. Tags come from a small fixed vocabulary, so
+        they are interned and every sequence shares the same string objects.
         """
-        if isinstance(keyword_raw, list):
-            tokens = keyword_raw
-        elif isinstance(keyword_raw, str):
-            tokens = keyword_raw.split(",")
-        else:
-            return []
-
-        keywords = []
-        for token in tokens:
-            value = str(token).strip()
-            if value:
-                keywords.append(value)
-        return keywords
+        return list(map(sys.intern, _split_csv(keyword_raw)))
 
 
 __all__ = ["Sequence"]
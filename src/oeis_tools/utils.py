@@ -20,7 +20,16 @@ from __future__ import annotations
 import re
 
 OEIS_URL = "https://oeis.org"
-OEIS_ID_PATTERN = re.compile(r"^A\d{6}$")
+OEIS_ID_PATTERN = re.compile(r"^A[0-9]{6}$")
+
+# URL templates per ``oeis_url`` format, filled with the ID and its digits.
+_URL_TEMPLATES = {
+    "json": OEIS_URL + "/search?q=id:{id}&fmt=json",
+    "text": OEIS_URL + "/search?q=id:{id}&fmt=text",
+    "bfile": OEIS_URL + "/{id}/b{digits}.txt",
+    "graph": OEIS_URL + "/{id}/graph?png=1",
+    None: OEIS_URL + "/{id}",
+}
 
 
 # A mapping of OEIS keyword tags to their descriptions, based on the OEIS wiki.
@@ -63,6 +72,9 @@ OEIS_KEYWORD_DESCRIPTIONS = {
     "uned": "Not edited; entry still needs editorial review.",
 }
 
+# The known keyword tags, for callers that only need to validate a tag.
+OEIS_KEYWORD_TAGS = frozenset(OEIS_KEYWORD_DESCRIPTIONS)
+
 
 def check_id(oeis_id: str) -> bool:
     """
@@ -78,7 +90,15 @@ def check_id(oeis_id: str) -> bool:
     if not isinstance(oeis_id, str):
         return False
 
-    return bool(OEIS_ID_PATTERN.fullmatch(oeis_id))
+    # Plain string checks are cheaper than a regex match for this fixed shape.
+    # isascii() rejects non-ASCII digits (e.g. '١') that isdigit() accepts.
+    digits = oeis_id[1:]
+    return (
+        len(oeis_id) == 7
+        and oeis_id[0] == "A"
+        and digits.isascii()
+        and digits.isdigit()
+    )
 
 
 def oeis_bfile(oeis_id: str) -> str:
@@ -99,10 +119,13 @@ def oeis_bfile(oeis_id: str) -> str:
     """
     if not check_id(oeis_id):
         raise ValueError(f"Invalid OEIS ID: {oeis_id}")
+    return _oeis_bfile_unchecked(oeis_id)
 
-    # Extract the 6 digits after 'A'
-    digits = oeis_id[1:]
-    return f"b{digits}.txt"
+
+def _oeis_bfile_unchecked(oeis_id: str) -> str:
+    """Return the b-file filename for an OEIS ID the caller already validated."""
+    # The 6 digits after 'A'
+    return f"b{oeis_id[1:]}.txt"
 
 
 def oeis_url(oeis_id: str, fmt: str | None = None) -> str:
@@ -120,17 +143,16 @@ def oeis_url(oeis_id: str, fmt: str | None = None) -> str:
 
     Returns:
         str: The URL.
+
+    Raises:
+        ValueError: If the oeis_id is not in the correct format.
     """
-    normalized_fmt = fmt.strip().lower() if isinstance(fmt, str) else fmt
+    if not check_id(oeis_id):
+        raise ValueError(f"Invalid OEIS ID: {oeis_id}")
 
-    formats = {
-        "json": f"{OEIS_URL}/search?q=id:{oeis_id}&fmt=json",
-        "text": f"{OEIS_URL}/search?q=id:{oeis_id}&fmt=text",
-        "bfile": f"{OEIS_URL}/{oeis_id}/{oeis_bfile(oeis_id)}",
-        "graph": f"{OEIS_URL}/{oeis_id}/graph?png=1",
-        None: f"{OEIS_URL}/{oeis_id}",
-    }
-    return formats.get(normalized_fmt, formats[None])
+    normalized_fmt = fmt.strip().lower() if isinstance(fmt, str) else fmt
+    template = _URL_TEMPLATES.get(normalized_fmt, _URL_TEMPLATES[None])
+    return template.format(id=oeis_id, digits=oeis_id[1:])
 
 
 def oeis_keyword_description(keyword_tag: str | None) -> str | None:
@@ -145,7 +167,13 @@ def oeis_keyword_description(keyword_tag: str | None) -> str | None:
     """
     if keyword_tag is None:
         return None
-    tag = str(keyword_tag).strip().lower()
+    if isinstance(keyword_tag, str):
+        tag = keyword_tag.strip()
+        # OEIS tags are already lowercase; only fold the odd mixed-case input.
+        if not tag.islower():
+            tag = tag.lower()
+    else:
+        tag = str(keyword_tag).strip().lower()
     if not tag:
         return None
     return OEIS_KEYWORD_DESCRIPTIONS.get(tag)
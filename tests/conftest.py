@@ -1,12 +1,78 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 EnriquePH
 
-"""Pytest configuration for local source imports."""
+"""Pytest configuration for local source imports and shared fixtures."""
 
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
 
 SRC_DIR = Path(__file__).resolve().parents[1] / "src"
 src_path = str(SRC_DIR)
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
+
+
+@pytest.fixture(autouse=True)
+def clear_json_cache(monkeypatch):
+    """Drop cached OEIS data so each test sees its own mocked payload."""
+    from oeis_tools._http import CACHE_DIR_ENV, CACHE_ENV, CACHE_TTL_ENV
+    from oeis_tools.sequence import Sequence
+
+    for name in (CACHE_ENV, CACHE_DIR_ENV, CACHE_TTL_ENV):
+        monkeypatch.delenv(name, raising=False)
+    Sequence.clear_cache()
+
+
+class FakeAxes:
+    """Matplotlib-like axes that records plotting calls and labels."""
+
+    def __init__(self):
+        self.plot_calls = []
+        self.scatter_calls = []
+        self.title = None
+        self.xlabel = None
+        self.ylabel = None
+
+    def plot(self, x, y, **kwargs):
+        self.plot_calls.append((list(x), list(y), kwargs))
+
+    def scatter(self, x, y, **kwargs):
+        self.scatter_calls.append((list(x), list(y), kwargs))
+
+    def get_title(self):
+        return self.title
+
+    def set_title(self, value):
+        self.title = value
+
+    def set_xlabel(self, value):
+        self.xlabel = value
+
+    def set_ylabel(self, value):
+        self.ylabel = value
+
+
+class FakePyplot:
+    """Minimal ``matplotlib.pyplot`` replacement handing out one ``FakeAxes``."""
+
+    def __init__(self):
+        self.axes = FakeAxes()
+        self.show_called = False
+
+    def subplots(self):
+        return object(), self.axes
+
+    def show(self):
+        self.show_called = True
+
+
+@pytest.fixture
+def fake_pyplot(monkeypatch):
+    """Install a fake ``matplotlib.pyplot`` module and return it."""
+    pyplot = FakePyplot()
+    monkeypatch.setitem(sys.modules, "matplotlib", SimpleNamespace(pyplot=pyplot))
+    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", pyplot)
+    return pyplot
@@ -3,8 +3,7 @@
 
 """Tests for ``oeis_tools.bfile.BFile``."""
 
-import sys
-from types import SimpleNamespace
+from array import array
 
 import pytest
 import requests
@@ -13,41 +12,94 @@ from oeis_tools.bfile import BFile, create_bfile
 
 
 class DummyResponse:
-    """Minimal response object used to mock ``requests.get``."""
+    """Minimal streaming response object used to mock ``SESSION.get``."""
 
     def __init__(self, text):
         """Store raw text returned by the fake request."""
         self.text = text
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
     def raise_for_status(self):
         """Mimic a successful HTTP response."""
         return None
 
+    def iter_lines(self, chunk_size=512):
+        """Yield the body line by line as bytes, like ``requests`` does."""
+        return iter(self.text.encode("ascii").splitlines())
+
 
 def test_bfile_parses_numeric_values_and_metadata(monkeypatch):
     """Parse b-file values and expose expected filename and URL."""
 
-    def fake_get(url, timeout):
+    def fake_get(url, timeout, stream=False):
         assert "A000045" in url
         assert timeout == 10
+        assert stream is True
         return DummyResponse("# comment\n0 0\n1 1\n2 1\n3 2\n")
 
-    monkeypatch.setattr("oeis_tools.bfile.requests.get", fake_get)
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
 
     bfile = BFile("A000045")
 
     assert bfile.get_filename() == "b000045.txt"
     assert bfile.get_url() == "https://oeis.org/A000045/b000045.txt"
-    assert bfile.get_bfile_data() == [0, 1, 1, 2]
+    assert bfile.get_bfile_data() == array("q", [0, 1, 1, 2])
+    assert bfile.get_bfile_indices() == array("q", [0, 1, 2, 3])
+
+
+def test_bfile_keeps_list_for_values_beyond_int64(monkeypatch):
+    """Fall back to a list of Python ints when values overflow int64."""
+    huge = 2**63
+
+    def fake_get(url, timeout, stream=False):
+        return DummyResponse(f"0 1\n1 {huge}\n2 {-huge - 1}\n")
+
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
+
+    bfile = BFile("A000045")
+
+    assert bfile.get_bfile_data() == [1, huge, -huge - 1]
+    assert isinstance(bfile.get_bfile_data(), list)
+    assert bfile.get_bfile_indices() == array("q", [0, 1, 2])
+
+
+def test_bfile_skips_blank_and_comment_lines_and_extra_columns(monkeypatch):
+    """Ignore whitespace-only and indented comment lines and trailing columns."""
+
+    def fake_get(url, timeout, stream=False):
+        return DummyResponse("  # header\n   \n0 5 extra\n\t1\t8  \r\n")
+
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
+
+    bfile = BFile("A000045")
+    assert list(bfile.get_bfile_data()) == [5, 8]
+    assert list(bfile.get_bfile_indices()) == [0, 1]
+
+
+def test_bfile_rejects_invalid_id_before_requesting(monkeypatch):
+    """Raise ``ValueError`` for a malformed ID without touching the network."""
+
+    def fake_get(url, timeout, stream=False):
+        raise AssertionError("no request expected")
+
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
+
+    with pytest.raises(ValueError, match="Invalid OEIS ID"):
+        BFile("A45")
 
 
 def test_bfile_returns_none_when_request_fails(monkeypatch):
     """Return ``None`` when the HTTP request fails."""
 
-    def fake_get(url, timeout):
+    def fake_get(url, timeout, stream=False):
         raise requests.RequestException("network error")
 
-    monkeypatch.setattr("oeis_tools.bfile.requests.get", fake_get)
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
 
     bfile = BFile("A000045")
     assert bfile.get_bfile_data() is None
@@ -56,57 +108,35 @@ def test_bfile_returns_none_when_request_fails(monkeypatch):
 def test_bfile_returns_none_for_malformed_line(monkeypatch):
     """Return ``None`` when a b-file line cannot be parsed."""
 
-    def fake_get(url, timeout):
+    def fake_get(url, timeout, stream=False):
         return DummyResponse("0 0\nthis-is-not-valid\n")
 
-    monkeypatch.setattr("oeis_tools.bfile.requests.get", fake_get)
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
 
     bfile = BFile("A000045")
     assert bfile.get_bfile_data() is None
 
 
-def test_bfile_plot_data_plots_values(monkeypatch):
-    """Plot parsed b-file values onto a matplotlib-like axes object."""
-
-    class FakeAxes:
-        def __init__(self):
-            self.plot_calls = []
-            self.title = None
-            self.xlabel = None
-            self.ylabel = None
-
-        def plot(self, x, y, **kwargs):
-            self.plot_calls.append((list(x), list(y), kwargs))
-
-        def set_title(self, value):
-            self.title = value
+def test_bfile_returns_none_for_non_integer_value(monkeypatch):
+    """Return ``None`` when a b-file column holds a non-integer token."""
 
-        def set_xlabel(self, value):
-            self.xlabel = value
+    def fake_get(url, timeout, stream=False):
+        return DummyResponse("0 0\n1 1.5\n")
 
-        def set_ylabel(self, value):
-            self.ylabel = value
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
 
-    class FakePyplot:
-        def __init__(self):
-            self.axes = FakeAxes()
-            self.show_called = False
-
-        def subplots(self):
-            return object(), self.axes
+    bfile = BFile("A000045")
+    assert bfile.get_bfile_data() is None
+    assert bfile.get_bfile_indices() is None
 
-        def show(self):
-            self.show_called = True
 
-    fake_pyplot = FakePyplot()
-    fake_matplotlib = SimpleNamespace(pyplot=fake_pyplot)
+def test_bfile_plot_data_plots_values(monkeypatch, fake_pyplot):
+    """Plot parsed b-file values onto a matplotlib-like axes object."""
 
-    def fake_get(url, timeout):
+    def fake_get(url, timeout, stream=False):
         return DummyResponse("0 2\n1 3\n2 5\n")
 
-    monkeypatch.setattr("oeis_tools.bfile.requests.get", fake_get)
-    monkeypatch.setitem(sys.modules, "matplotlib", fake_matplotlib)
-    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", fake_pyplot)
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
 
     bfile = BFile("A000045")
     result = bfile.plot_data(show=False, color="black")
@@ -119,47 +149,13 @@ def test_bfile_plot_data_plots_values(monkeypatch):
     assert fake_pyplot.show_called is False
 
 
-def test_bfile_plot_data_uses_bfile_indices_for_x_axis(monkeypatch):
+def test_bfile_plot_data_uses_bfile_indices_for_x_axis(monkeypatch, fake_pyplot):
     """Use parsed b-file indices as x values when available."""
 
-    class FakeAxes:
-        def __init__(self):
-            self.plot_calls = []
-            self.title = None
-            self.xlabel = None
-            self.ylabel = None
-
-        def plot(self, x, y, **kwargs):
-            self.plot_calls.append((list(x), list(y), kwargs))
-
-        def set_title(self, value):
-            self.title = value
-
-        def set_xlabel(self, value):
-            self.xlabel = value
-
-        def set_ylabel(self, value):
-            self.ylabel = value
-
-    class FakePyplot:
-        def __init__(self):
-            self.axes = FakeAxes()
-
-        def subplots(self):
-            return object(), self.axes
-
-        def show(self):
-            return None
-
-    fake_pyplot = FakePyplot()
-    fake_matplotlib = SimpleNamespace(pyplot=fake_pyplot)
-
-    def fake_get(url, timeout):
+    def fake_get(url, timeout, stream=False):
         return DummyResponse("10 2\n20 3\n40 5\n")
 
-    monkeypatch.setattr("oeis_tools.bfile.requests.get", fake_get)
-    monkeypatch.setitem(sys.modules, "matplotlib", fake_matplotlib)
-    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", fake_pyplot)
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
 
     bfile = BFile("A000045")
     result = bfile.plot_data(show=False)
@@ -169,48 +165,13 @@ def test_bfile_plot_data_uses_bfile_indices_for_x_axis(monkeypatch):
     assert fake_pyplot.axes.xlabel == "n"
 
 
-def test_bfile_plot_data_scatter_uses_scatter(monkeypatch):
+def test_bfile_plot_data_scatter_uses_scatter(monkeypatch, fake_pyplot):
     """Plot parsed b-file values using a scatter plot when requested."""
 
-    class FakeAxes:
-        def __init__(self):
-            self.plot_calls = []
-            self.scatter_calls = []
-
-        def plot(self, x, y, **kwargs):
-            self.plot_calls.append((list(x), list(y), kwargs))
-
-        def scatter(self, x, y, **kwargs):
-            self.scatter_calls.append((list(x), list(y), kwargs))
-
-        def set_title(self, value):
-            return None
-
-        def set_xlabel(self, value):
-            return None
-
-        def set_ylabel(self, value):
-            return None
-
-    class FakePyplot:
-        def __init__(self):
-            self.axes = FakeAxes()
-
-        def subplots(self):
-            return object(), self.axes
-
-        def show(self):
-            return None
-
-    fake_pyplot = FakePyplot()
-    fake_matplotlib = SimpleNamespace(pyplot=fake_pyplot)
-
-    def fake_get(url, timeout):
+    def fake_get(url, timeout, stream=False):
         return DummyResponse("0 2\n1 3\n2 5\n")
 
-    monkeypatch.setattr("oeis_tools.bfile.requests.get", fake_get)
-    monkeypatch.setitem(sys.modules, "matplotlib", fake_matplotlib)
-    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", fake_pyplot)
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
 
     bfile = BFile("A000045")
     bfile.plot_data(show=False, plot_style="scatter", color="black")
@@ -221,47 +182,13 @@ def test_bfile_plot_data_scatter_uses_scatter(monkeypatch):
     ]
 
 
-def test_bfile_plot_data_accepts_n_for_prefix_plot(monkeypatch):
+def test_bfile_plot_data_accepts_n_for_prefix_plot(monkeypatch, fake_pyplot):
     """Plot only the first ``n`` b-file points when requested."""
 
-    class FakeAxes:
-        def __init__(self):
-            self.plot_calls = []
-            self.title = None
-            self.xlabel = None
-            self.ylabel = None
-
-        def plot(self, x, y, **kwargs):
-            self.plot_calls.append((list(x), list(y), kwargs))
-
-        def set_title(self, value):
-            self.title = value
-
-        def set_xlabel(self, value):
-            self.xlabel = value
-
-        def set_ylabel(self, value):
-            self.ylabel = value
-
-    class FakePyplot:
-        def __init__(self):
-            self.axes = FakeAxes()
-
-        def subplots(self):
-            return object(), self.axes
-
-        def show(self):
-            return None
-
-    fake_pyplot = FakePyplot()
-    fake_matplotlib = SimpleNamespace(pyplot=fake_pyplot)
-
-    def fake_get(url, timeout):
+    def fake_get(url, timeout, stream=False):
         return DummyResponse("10 2\n20 3\n40 5\n80 8\n")
 
-    monkeypatch.setattr("oeis_tools.bfile.requests.get", fake_get)
-    monkeypatch.setitem(sys.modules, "matplotlib", fake_matplotlib)
-    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", fake_pyplot)
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
 
     bfile = BFile("A000045")
     result = bfile.plot_data(2, show=False)
@@ -273,10 +200,10 @@ def test_bfile_plot_data_accepts_n_for_prefix_plot(monkeypatch):
 def test_bfile_plot_data_rejects_invalid_n(monkeypatch):
     """Validate ``n`` type and bounds for plotting."""
 
-    def fake_get(url, timeout):
+    def fake_get(url, timeout, stream=False):
         return DummyResponse("0 2\n1 3\n")
 
-    monkeypatch.setattr("oeis_tools.bfile.requests.get", fake_get)
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
 
     bfile = BFile("A000045")
 
@@ -290,58 +217,23 @@ def test_bfile_plot_data_rejects_invalid_n(monkeypatch):
 def test_bfile_plot_data_raises_when_data_missing(monkeypatch):
     """Reject plotting when b-file data is unavailable."""
 
-    def fake_get(url, timeout):
+    def fake_get(url, timeout, stream=False):
         raise requests.RequestException("network error")
 
-    monkeypatch.setattr("oeis_tools.bfile.requests.get", fake_get)
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
 
     bfile = BFile("A000045")
     with pytest.raises(ValueError, match="No b-file data available to plot"):
         bfile.plot_data(show=False)
 
 
-def test_bfile_plot_data_uses_log10_for_very_large_values(monkeypatch):
+def test_bfile_plot_data_uses_log10_for_very_large_values(monkeypatch, fake_pyplot):
     """Fallback to signed log10 plotting when values exceed float range."""
 
-    class FakeAxes:
-        def __init__(self):
-            self.plot_calls = []
-            self.title = None
-            self.xlabel = None
-            self.ylabel = None
-
-        def plot(self, x, y, **kwargs):
-            self.plot_calls.append((list(x), list(y), kwargs))
-
-        def set_title(self, value):
-            self.title = value
-
-        def set_xlabel(self, value):
-            self.xlabel = value
-
-        def set_ylabel(self, value):
-            self.ylabel = value
-
-    class FakePyplot:
-        def __init__(self):
-            self.axes = FakeAxes()
-            self.show_called = False
-
-        def subplots(self):
-            return object(), self.axes
-
-        def show(self):
-            self.show_called = True
-
-    fake_pyplot = FakePyplot()
-    fake_matplotlib = SimpleNamespace(pyplot=fake_pyplot)
-
-    def fake_get(url, timeout):
+    def fake_get(url, timeout, stream=False):
         return DummyResponse("0 0\n1 2\n2 -3\n3 1" + "0" * 400 + "\n")
 
-    monkeypatch.setattr("oeis_tools.bfile.requests.get", fake_get)
-    monkeypatch.setitem(sys.modules, "matplotlib", fake_matplotlib)
-    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", fake_pyplot)
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
 
     bfile = BFile("A000045")
     result = bfile.plot_data(show=False, color="blue")
@@ -358,44 +250,13 @@ def test_bfile_plot_data_uses_log10_for_very_large_values(monkeypatch):
     assert fake_pyplot.axes.ylabel == "sign(value) * log10(|value|)"
 
 
-def test_bfile_plot_data_can_return_axes_when_requested(monkeypatch):
+def test_bfile_plot_data_can_return_axes_when_requested(monkeypatch, fake_pyplot):
     """Return axes only when ``return_ax=True`` is passed."""
 
-    class FakeAxes:
-        def __init__(self):
-            self.plot_calls = []
-
-        def plot(self, x, y, **kwargs):
-            self.plot_calls.append((list(x), list(y), kwargs))
-
-        def set_title(self, value):
-            return None
-
-        def set_xlabel(self, value):
-            return None
-
-        def set_ylabel(self, value):
-            return None
-
-    class FakePyplot:
-        def __init__(self):
-            self.axes = FakeAxes()
-
-        def subplots(self):
-            return object(), self.axes
-
-        def show(self):
-            return None
-
-    fake_pyplot = FakePyplot()
-    fake_matplotlib = SimpleNamespace(pyplot=fake_pyplot)
-
-    def fake_get(url, timeout):
+    def fake_get(url, timeout, stream=False):
         return DummyResponse("0 2\n1 3\n2 5\n")
 
-    monkeypatch.setattr("oeis_tools.bfile.requests.get", fake_get)
-    monkeypatch.setitem(sys.modules, "matplotlib", fake_matplotlib)
-    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", fake_pyplot)
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
 
     bfile = BFile("A000045")
     ax = bfile.plot_data(show=False, return_ax=True)
@@ -430,39 +291,11 @@ def test_create_bfile_exact_path(tmp_path):
         assert f.read() == "1 100\n"
 
 
-def test_bfile_plot_data_style_joined(monkeypatch):
-    class FakeAxes:
-        def __init__(self):
-            self.plot_calls = []
-
-        def plot(self, x, y, **kwargs):
-            self.plot_calls.append((list(x), list(y), kwargs))
-
-        def set_title(self, value):
-            pass
-
-        def set_xlabel(self, value):
-            pass
-
-        def set_ylabel(self, value):
-            pass
-
-    class FakePyplot:
-        def __init__(self):
-            self.axes = FakeAxes()
-
-        def subplots(self):
-            return object(), self.axes
-
-        def show(self):
-            pass
-
-    fake_pyplot = FakePyplot()
+def test_bfile_plot_data_style_joined(monkeypatch, fake_pyplot):
     monkeypatch.setattr(
-        "oeis_tools.bfile.requests.get", lambda url, timeout: DummyResponse("0 2\n")
+        "oeis_tools._http.SESSION.get",
+        lambda url, timeout, stream=False: DummyResponse("0 2\n"),
     )
-    monkeypatch.setitem(sys.modules, "matplotlib", SimpleNamespace(pyplot=fake_pyplot))
-    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", fake_pyplot)
 
     bfile = BFile("A000045")
     bfile.plot_data(show=False, plot_style="joined")
@@ -471,7 +304,8 @@ def test_bfile_plot_data_style_joined(monkeypatch):
 
 def test_bfile_plot_data_invalid_style(monkeypatch):
     monkeypatch.setattr(
-        "oeis_tools.bfile.requests.get", lambda url, timeout: DummyResponse("0 2\n")
+        "oeis_tools._http.SESSION.get",
+        lambda url, timeout, stream=False: DummyResponse("0 2\n"),
     )
     bfile = BFile("A000045")
     with pytest.raises(ValueError, match="plot_style must be one of"):
@@ -480,7 +314,8 @@ def test_bfile_plot_data_invalid_style(monkeypatch):
 
 def test_bfile_plot_data_matplotlib_missing(monkeypatch):
     monkeypatch.setattr(
-        "oeis_tools.bfile.requests.get", lambda url, timeout: DummyResponse("0 2\n")
+        "oeis_tools._http.SESSION.get",
+        lambda url, timeout, stream=False: DummyResponse("0 2\n"),
     )
     bfile = BFile("A000045")
 
@@ -499,42 +334,12 @@ def test_bfile_plot_data_matplotlib_missing(monkeypatch):
         bfile.plot_data(show=False)
 
 
-def test_bfile_plot_data_huge_log10_line(monkeypatch):
-    class FakeAxes:
-        def __init__(self):
-            self.plot_calls = []
-
-        def plot(self, x, y, **kwargs):
-            self.plot_calls.append((list(x), list(y), kwargs))
-
-        def set_title(self, value):
-            pass
-
-        def set_xlabel(self, value):
-            pass
-
-        def set_ylabel(self, value):
-            pass
-
-    class FakePyplot:
-        def __init__(self):
-            self.axes = FakeAxes()
-
-        def subplots(self):
-            return object(), self.axes
-
-        def show(self):
-            pass
-
-    fake_pyplot = FakePyplot()
-
+def test_bfile_plot_data_huge_log10_line(monkeypatch, fake_pyplot):
     huge = 10**400
     monkeypatch.setattr(
-        "oeis_tools.bfile.requests.get",
-        lambda url, timeout: DummyResponse(f"0 0\n1 {huge}\n"),
+        "oeis_tools._http.SESSION.get",
+        lambda url, timeout, stream=False: DummyResponse(f"0 0\n1 {huge}\n"),
     )
-    monkeypatch.setitem(sys.modules, "matplotlib", SimpleNamespace(pyplot=fake_pyplot))
-    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", fake_pyplot)
 
     bfile = BFile("A000045")
     bfile.plot_data(show=False, plot_style="line")
@@ -542,84 +347,30 @@ def test_bfile_plot_data_huge_log10_line(monkeypatch):
     assert fake_pyplot.axes.plot_calls[0][1][1] == pytest.approx(400.0, rel=1e-6)
 
 
-def test_bfile_plot_data_existing_title_combined(monkeypatch):
-    class FakeAxes:
-        def __init__(self):
-            self.title = "Existing b-file data"
-
-        def plot(self, x, y, **kwargs):
-            pass
-
-        def get_title(self):
-            return self.title
-
-        def set_title(self, value):
-            self.title = value
-
-        def set_xlabel(self, value):
-            pass
-
-        def set_ylabel(self, value):
-            pass
-
-    class FakePyplot:
-        def __init__(self):
-            self.axes = FakeAxes()
-
-        def subplots(self):
-            return object(), self.axes
-
-        def show(self):
-            pass
-
-    fake_pyplot = FakePyplot()
+def test_bfile_plot_data_existing_title_combined(monkeypatch, fake_pyplot):
     monkeypatch.setattr(
-        "oeis_tools.bfile.requests.get", lambda url, timeout: DummyResponse("0 2\n")
+        "oeis_tools._http.SESSION.get",
+        lambda url, timeout, stream=False: DummyResponse("0 2\n"),
     )
-    monkeypatch.setitem(sys.modules, "matplotlib", SimpleNamespace(pyplot=fake_pyplot))
-    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", fake_pyplot)
+
+    fake_pyplot.axes.title = "Existing b-file data"
 
     bfile = BFile("A000045")
     bfile.plot_data(show=False, ax=fake_pyplot.axes)
     assert fake_pyplot.axes.title == "Existing + A000045 b-file data"
 
 
-def test_bfile_plot_data_get_title_typeerror(monkeypatch):
-    class FakeAxes:
-        def __init__(self):
-            self.title = "Some Title"
-
-        def plot(self, x, y, **kwargs):
-            pass
-
-        def get_title(self):
-            raise TypeError("mocked typeerror")
-
-        def set_title(self, value):
-            self.title = value
-
-        def set_xlabel(self, value):
-            pass
-
-        def set_ylabel(self, value):
-            pass
-
-    class FakePyplot:
-        def __init__(self):
-            self.axes = FakeAxes()
-
-        def subplots(self):
-            return object(), self.axes
-
-        def show(self):
-            pass
-
-    fake_pyplot = FakePyplot()
+def test_bfile_plot_data_get_title_typeerror(monkeypatch, fake_pyplot):
     monkeypatch.setattr(
-        "oeis_tools.bfile.requests.get", lambda url, timeout: DummyResponse("0 2\n")
+        "oeis_tools._http.SESSION.get",
+        lambda url, timeout, stream=False: DummyResponse("0 2\n"),
     )
-    monkeypatch.setitem(sys.modules, "matplotlib", SimpleNamespace(pyplot=fake_pyplot))
-    monkeypatch.setitem(sys.modules, "matplotlib.pyplot", fake_pyplot)
+
+    def raise_type_error():
+        raise TypeError("mocked typeerror")
+
+    fake_pyplot.axes.title = "Some Title"
+    monkeypatch.setattr(fake_pyplot.axes, "get_title", raise_type_error)
 
     bfile = BFile("A000045")
     bfile.plot_data(show=False, ax=fake_pyplot.axes)
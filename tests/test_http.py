@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 EnriquePH
+
+"""Tests for the shared HTTP helpers in ``oeis_tools._http``."""
+
+import os
+
+from oeis_tools._http import (
+    _STREAM_CHUNK_SIZE,
+    CACHE_DIR_ENV,
+    CACHE_ENV,
+    CACHE_TTL_ENV,
+    get_content,
+    iter_content_lines,
+)
+
+URL = "https://oeis.org/A000045/b000045.txt"
+
+
+class DummyResponse:
+    """Minimal response object with status, headers and a body."""
+
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError("HTTP error")
+
+
+def test_get_content_without_cache_returns_body(monkeypatch):
+    """Without a cache directory the body is fetched directly."""
+    monkeypatch.setattr(
+        "oeis_tools._http.SESSION.get",
+        lambda url, timeout: DummyResponse(content=b"0 0\n"),
+    )
+
+    assert get_content(URL, timeout=10) == b"0 0\n"
+
+
+def test_iter_content_lines_streams_in_large_chunks(monkeypatch):
+    """Without a cache the body is streamed with a large read size."""
+    chunk_sizes = []
+
+    class StreamingResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return None
+
+        def raise_for_status(self):
+            return None
+
+        def iter_lines(self, chunk_size=512):
+            chunk_sizes.append(chunk_size)
+            return iter([b"0 0", b"1 1"])
+
+    monkeypatch.setattr(
+        "oeis_tools._http.SESSION.get",
+        lambda url, timeout, stream: StreamingResponse(),
+    )
+
+    assert list(iter_content_lines(URL, timeout=10)) == [b"0 0", b"1 1"]
+    assert chunk_sizes == [_STREAM_CHUNK_SIZE]
+    assert _STREAM_CHUNK_SIZE >= 64 * 1024
+
+
+def test_get_content_revalidates_cached_body(monkeypatch, tmp_path):
+    """A cached body is reused when the server answers 304 Not Modified."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.setenv(CACHE_TTL_ENV, "0")
+    calls = []
+
+    def fake_get(url, timeout, headers):
+        calls.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return DummyResponse(status_code=304)
+        return DummyResponse(content=b"0 0\n1 1\n", headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
+
+    assert get_content(URL, timeout=10) == b"0 0\n1 1\n"
+    assert list(iter_content_lines(URL, timeout=10)) == [b"0 0", b"1 1"]
+    assert calls == [{}, {"If-None-Match": '"v1"'}]
+
+
+def test_get_content_skips_cache_without_validators(monkeypatch, tmp_path):
+    """Without a TTL, responses lacking ETag/Last-Modified are not stored."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.setenv(CACHE_TTL_ENV, "0")
+    monkeypatch.setattr(
+        "oeis_tools._http.SESSION.get",
+        lambda url, timeout, headers: DummyResponse(content=b"0 0\n"),
+    )
+
+    assert get_content(URL, timeout=10) == b"0 0\n"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_get_content_serves_fresh_cache_without_request(monkeypatch, tmp_path):
+    """OEIS_TOOLS_CACHE=1 caches under XDG_CACHE_HOME and skips fresh GETs."""
+    monkeypatch.setenv(CACHE_ENV, "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    calls = []
+
+    def fake_get(url, timeout, headers):
+        calls.append(url)
+        return DummyResponse(content=b"[{}]")
+
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
+
+    assert get_content(URL, timeout=10) == b"[{}]"
+    assert get_content(URL, timeout=10) == b"[{}]"
+    assert calls == [URL]
+    assert any((tmp_path / "oeis_tools").iterdir())
+
+
+def test_get_content_never_serves_a_partial_cache_write(monkeypatch, tmp_path):
+    """A write interrupted before completion leaves no body to serve."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    calls = []
+    interrupted = [True]
+    real_replace = os.replace
+
+    def fake_get(url, timeout, headers):
+        calls.append(url)
+        return DummyResponse(content=b"0 0\n1 1\n2 1\n")
+
+    def replace(src, dst):
+        if interrupted[0]:
+            raise OSError("interrupted")
+        real_replace(src, dst)
+
+    monkeypatch.setattr("oeis_tools._http.SESSION.get", fake_get)
+    monkeypatch.setattr("oeis_tools._http.os.replace", replace)
+
+    assert get_content(URL, timeout=10) == b"0 0\n1 1\n2 1\n"
+    assert list(tmp_path.iterdir()) == []
+
+    interrupted[0] = False
+    assert get_content(URL, timeout=10) == b"0 0\n1 1\n2 1\n"
+    assert get_content(URL, timeout=10) == b"0 0\n1 1\n2 1\n"
+    assert calls == [URL, URL]
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == [".body", ".json"]
+
+
+def test_session_sends_package_user_agent():
+    """Requests identify the package and version to oeis.org."""
+    from oeis_tools import __version__
+    from oeis_tools._http import SESSION
+
+    assert SESSION.headers["User-Agent"].startswith(f"oeis-tools/{__version__}")
+
+
+def test_close_session_keeps_session_usable(monkeypatch):
+    """Closing the shared session only drops its pooled connections."""
+    from oeis_tools import close_session
+
+    close_session()
+    monkeypatch.setattr(
+        "oeis_tools._http.SESSION.get",
+        lambda url, timeout: DummyResponse(content=b"ok"),
+    )
+
+    assert get_content(URL, timeout=10) == b"ok"
@@ -3,6 +3,10 @@
 
 """Tests for ``oeis_tools.sequence.Sequence``."""
 
+import json
+import pickle
+import sys
+from concurrent.futures import Future
 from datetime import datetime
 
 import pytest
@@ -15,8 +19,8 @@ class DummyResponse:
     """Minimal JSON response object for mocking API calls."""
 
     def __init__(self, payload, error=None):
-        """Store mock payload and optional HTTP error."""
-        self._payload = payload
+        """Store mock payload as encoded JSON bytes and optional HTTP error."""
+        self.content = json.dumps(payload).encode("utf-8")
         self._error = error
 
     def raise_for_status(self):
@@ -25,10 +29,6 @@ class DummyResponse:
             raise self._error
         return None
 
-    def json(self):
-        """Return the stored JSON payload."""
-        return self._payload
-
 
 class DummyBinaryResponse:
     """Minimal binary response object for mocking image downloads."""
@@ -63,6 +63,16 @@ class DummyBFile:
         return None
 
 
+class CountingBFile(DummyBFile):
+    """``DummyBFile`` that records every ID it is created for."""
+
+    created = []
+
+    def __init__(self, oeis_id):
+        super().__init__(oeis_id)
+        self.created.append(oeis_id)
+
+
 def test_sequence_parses_json_fields_and_builds_links(monkeypatch):
     """Parse key OEIS fields, datetimes, links, and b-file integration."""
     payload = [
@@ -94,7 +104,7 @@ def test_sequence_parses_json_fields_and_builds_links(monkeypatch):
     ]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -116,7 +126,7 @@ def test_sequence_parses_json_fields_and_builds_links(monkeypatch):
     assert seq.created == datetime(2000, 1, 1, 0, 0, 0)
     assert "[Main entry](https://oeis.org/A000045)" in seq.link
     assert "[External ref](https://example.com/ref)" in seq.link
-    assert "[wiki](https://oeis.org/wiki)" in seq.link
+    assert "See also [wiki](https://oeis.org/wiki)" in seq.link
     assert isinstance(seq.bfile, DummyBFile)
     assert seq.bfile.oeis_id == "A000045"
 
@@ -133,12 +143,216 @@ def test_sequence_propagates_http_error(monkeypatch):
     def fake_get(url, timeout):
         return DummyResponse(payload=None, error=requests.HTTPError("request failed"))
 
-    monkeypatch.setattr("oeis_tools.sequence.requests.get", fake_get)
+    monkeypatch.setattr("oeis_tools.sequence.SESSION.get", fake_get)
 
     with pytest.raises(requests.HTTPError, match="request failed"):
         Sequence("A000001")
 
 
+def test_sequence_reuses_cached_json_for_repeated_ids(monkeypatch):
+    """Fetch the JSON record once when the same ID is loaded twice."""
+    calls = []
+
+    def fake_get(url, timeout):
+        calls.append(url)
+        return DummyResponse([{"id": "M0001 N0001", "name": "Cached", "link": []}])
+
+    monkeypatch.setattr("oeis_tools.sequence.SESSION.get", fake_get)
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    first = Sequence("A000001")
+    second = Sequence("A000001")
+
+    assert calls == ["https://oeis.org/search?q=id:A000001&fmt=json"]
+    assert first.name == second.name == "Cached"
+
+
+def test_sequence_cached_json_is_not_shared_between_instances(monkeypatch):
+    """Give each instance its own decoded record so mutations stay local."""
+    monkeypatch.setattr(
+        "oeis_tools.sequence.SESSION.get",
+        lambda url, timeout: DummyResponse(
+            [{"id": "M0001 N0001", "name": "Original", "link": []}]
+        ),
+    )
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    first = Sequence("A000001")
+    first.json["name"] = "mutated"
+
+    second = Sequence("A000001")
+    assert second.json is not first.json
+    assert second.name == "Original"
+
+
+def test_sequence_get_returns_memoized_instance(monkeypatch):
+    """Return the same object for repeated ``Sequence.get`` calls."""
+    monkeypatch.setattr(
+        "oeis_tools.sequence.SESSION.get",
+        lambda url, timeout: DummyResponse([{"id": "M0001 N0001", "link": []}]),
+    )
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    first = Sequence.get("A000001")
+
+    assert Sequence.get("A000001") is first
+    assert Sequence("A000001") is not first
+
+
+def test_sequence_clear_cache_fetches_fresh_record(monkeypatch):
+    """Download the record again after ``Sequence.clear_cache``."""
+    names = iter(["Old", "New"])
+
+    def fake_get(url, timeout):
+        return DummyResponse([{"id": "M0001 N0001", "name": next(names), "link": []}])
+
+    monkeypatch.setattr("oeis_tools.sequence.SESSION.get", fake_get)
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    stale = Sequence.get("A000001")
+    assert Sequence("A000001").name == "Old"
+
+    Sequence.clear_cache()
+
+    assert Sequence("A000001").name == "New"
+    assert Sequence.get("A000001") is not stale
+
+
+def test_sequence_parses_secondary_fields_on_first_access(monkeypatch):
+    """Leave lazy fields unset until read, then cache them in their slots."""
+    monkeypatch.setattr(
+        "oeis_tools.sequence.SESSION.get",
+        lambda url, timeout: DummyResponse(
+            [{"id": "M0692 N0256", "author": "_N. J. A. Sloane_", "link": []}]
+        ),
+    )
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    seq = Sequence("A000001")
+    author_slot = Sequence.__dict__["author"]
+
+    with pytest.raises(AttributeError):
+        author_slot.__get__(seq)
+    assert seq.author == ["N. J. A. Sloane"]
+    assert author_slot.__get__(seq) is seq.author
+    assert (seq.m_id, seq.n_id) == ("M0692", "N0256")
+
+    seq.comment = "overridden"
+    assert seq.comment == "overridden"
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        seq.missing
+
+
+def test_sequence_parse_field_rejects_unknown_lazy_field(monkeypatch):
+    """Raise instead of falling through to another field's parser."""
+    monkeypatch.setattr(
+        "oeis_tools.sequence.SESSION.get",
+        lambda url, timeout: DummyResponse(
+            [{"id": "M0001 N0001", "link": ['<a href="/x">x</a>']}]
+        ),
+    )
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    seq = Sequence("A000001")
+
+    with pytest.raises(AttributeError, match="no parser for lazy field 'unknown'"):
+        seq._parse_field("unknown")
+
+
+def test_sequence_fetches_bfile_lazily(monkeypatch):
+    """Create the b-file only on first access to ``bfile``."""
+    created = []
+    monkeypatch.setattr(CountingBFile, "created", created)
+
+    monkeypatch.setattr(
+        "oeis_tools.sequence.SESSION.get",
+        lambda url, timeout: DummyResponse([{"id": "M0001 N0001", "link": []}]),
+    )
+    monkeypatch.setattr("oeis_tools.sequence.BFile", CountingBFile)
+
+    seq = Sequence("A000001")
+    assert created == []
+
+    bfile = seq.bfile
+    assert seq.bfile is bfile
+    assert created == ["A000001"]
+
+
+def test_sequence_prefetch_bfile_reuses_background_download(monkeypatch):
+    """Resolve ``bfile`` from the download started by ``prefetch_bfile``."""
+    created = []
+    monkeypatch.setattr(CountingBFile, "created", created)
+
+    monkeypatch.setattr(
+        "oeis_tools.sequence.SESSION.get",
+        lambda url, timeout: DummyResponse([{"id": "M0001 N0001", "link": []}]),
+    )
+    monkeypatch.setattr("oeis_tools.sequence.BFile", CountingBFile)
+
+    seq = Sequence("A000001")
+    seq.prefetch_bfile()
+    seq.prefetch_bfile()
+
+    assert isinstance(seq.bfile, CountingBFile)
+    assert created == ["A000001"]
+
+
+def test_sequence_assigned_bfile_overrides_pending_prefetch(monkeypatch):
+    """Prefer an assigned ``bfile`` over a download still in progress."""
+    monkeypatch.setattr(
+        "oeis_tools.sequence.SESSION.get",
+        lambda url, timeout: DummyResponse([{"id": "M0001 N0001", "link": []}]),
+    )
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    seq = Sequence("A000001")
+    seq.prefetch_bfile()
+    assigned = DummyBFile("A000001")
+    seq.bfile = assigned
+
+    assert seq._bfile_future is None
+    assert seq.bfile is assigned
+
+
+def test_sequence_pickles_with_pending_bfile_prefetch(monkeypatch):
+    """Drop an in-flight b-file download when pickling a sequence."""
+    monkeypatch.setattr(
+        "oeis_tools.sequence.SESSION.get",
+        lambda url, timeout: DummyResponse(
+            [{"id": "M0692 N0256", "name": "Pickled", "link": []}]
+        ),
+    )
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    seq = Sequence("A000001")
+    seq._bfile_future = Future()
+
+    restored = pickle.loads(pickle.dumps(seq))
+
+    assert restored.name == "Pickled"
+    assert restored.m_id == "M0692"
+    assert restored._bfile_future is None
+    assert isinstance(restored.bfile, DummyBFile)
+
+
+def test_sequence_pickles_finished_bfile_prefetch(monkeypatch):
+    """Keep a completed b-file download when pickling a sequence."""
+    monkeypatch.setattr(
+        "oeis_tools.sequence.SESSION.get",
+        lambda url, timeout: DummyResponse([{"id": "M0001 N0001", "link": []}]),
+    )
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    seq = Sequence("A000001")
+    seq.prefetch_bfile()
+    seq._bfile_future.result()
+
+    restored = pickle.loads(pickle.dumps(seq))
+
+    assert restored._bfile_future is None
+    assert restored._bfile.oeis_id == "A000001"
+
+
 def test_sequence_author_ignores_trailing_year_tokens(monkeypatch):
     """Drop year-only entries when parsing the OEIS author field."""
     payload = [
@@ -150,7 +364,7 @@ def test_sequence_author_ignores_trailing_year_tokens(monkeypatch):
     ]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -170,7 +384,7 @@ def test_sequence_author_ignores_trailing_full_date_tokens(monkeypatch):
     ]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -179,6 +393,14 @@ def test_sequence_author_ignores_trailing_full_date_tokens(monkeypatch):
     assert seq.author == ["Pierre CAMI"]
 
 
+def test_is_date_token_matches_each_supported_date_form():
+    """Recognise years and the three full-date forms, but not names."""
+    for value in ("1964", "Apr 28 2012", "Sept. 8, 2012", "28 Apr 2012", "2012-04-28"):
+        assert Sequence._is_date_token(value) is True
+    for value in ("N. J. A. Sloane", "12345", "2012-04", "Apr 2012"):
+        assert Sequence._is_date_token(value) is False
+
+
 def test_sequence_offset_ignores_invalid_tokens(monkeypatch):
     """Parse integer offsets and ignore malformed tokens."""
     payload = [
@@ -190,7 +412,7 @@ def test_sequence_offset_ignores_invalid_tokens(monkeypatch):
     ]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -210,7 +432,7 @@ def test_sequence_keyword_splits_and_ignores_empty_tokens(monkeypatch):
     ]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -234,7 +456,7 @@ def test_sequence_get_bfile_info_with_data(monkeypatch):
             return [0, 1, 1, 2, 3]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", BFileWithData)
@@ -257,7 +479,7 @@ def test_sequence_get_bfile_info_without_data(monkeypatch):
     payload = [{"id": "M0001 N0001", "link": []}]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -292,7 +514,7 @@ def test_sequence_get_xref_ids_extracts_unique_oeis_ids(monkeypatch):
     ]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -329,6 +551,26 @@ def test_sequence_get_xref_ids_extracts_unique_oeis_ids(monkeypatch):
     ]
 
 
+def test_sequence_get_xref_ids_ignores_ids_embedded_in_longer_tokens(monkeypatch):
+    """Skip A-number lookalikes that are part of a longer word or number."""
+    payload = [
+        {
+            "id": "M0001 N0001",
+            "xref": ["Cf. A000045, XA000040, A0000451, (A000142)."],
+            "link": [],
+        }
+    ]
+
+    monkeypatch.setattr(
+        "oeis_tools.sequence.SESSION.get",
+        lambda url, timeout: DummyResponse(payload),
+    )
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    seq = Sequence("A000001")
+    assert seq.get_xref_ids() == ["A000045", "A000142"]
+
+
 def test_sequence_get_data_values_parses_integer_terms(monkeypatch):
     """Parse OEIS data string into integer values."""
     payload = [
@@ -340,7 +582,7 @@ def test_sequence_get_data_values_parses_integer_terms(monkeypatch):
     ]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -360,7 +602,7 @@ def test_sequence_get_data_values_ignores_non_numeric_fragments(monkeypatch):
     ]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -374,7 +616,7 @@ def test_sequence_get_keyword_description_returns_lookup_value(monkeypatch):
     payload = [{"id": "M0001 N0001", "keyword": "nonn, easy", "link": []}]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -394,7 +636,7 @@ def test_sequence_get_keyword_description_normalizes_tag_input(monkeypatch):
     payload = [{"id": "M0001 N0001", "keyword": "nonn, easy", "link": []}]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -419,7 +661,7 @@ def test_sequence_get_graph_png_downloads_and_caches(monkeypatch):
         calls["graph"] += 1
         return DummyBinaryResponse(png_bytes)
 
-    monkeypatch.setattr("oeis_tools.sequence.requests.get", fake_get)
+    monkeypatch.setattr("oeis_tools.sequence.SESSION.get", fake_get)
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
 
     seq = Sequence("A000001")
@@ -429,6 +671,19 @@ def test_sequence_get_graph_png_downloads_and_caches(monkeypatch):
     assert calls["graph"] == 1
 
 
+def test_format_link_converts_every_anchor_and_keeps_surrounding_text():
+    """Rewrite all anchors in one entry without dropping the text between them."""
+    link = (
+        'N. J. A. Sloane, <a href="/A000045/b000045.txt">Table</a> and '
+        '<a href="https://example.com">More</a>'
+    )
+
+    assert Sequence._format_link(link) == (
+        "N. J. A. Sloane, [Table](https://oeis.org/A000045/b000045.txt) and "
+        "[More](https://example.com)"
+    )
+
+
 # ---- Tests for link parsing fallback (lines 142-143) ----
 
 
@@ -444,7 +699,7 @@ def test_sequence_link_parsing_fallback_for_non_anchor_links(monkeypatch):
     ]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -466,7 +721,7 @@ def test_sequence_get_graph_image_returns_bytes_without_ipython(monkeypatch):
             return DummyResponse(payload)
         return DummyBinaryResponse(png_bytes)
 
-    monkeypatch.setattr("oeis_tools.sequence.requests.get", fake_get)
+    monkeypatch.setattr("oeis_tools.sequence.SESSION.get", fake_get)
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
 
     seq = Sequence("A000001")
@@ -501,7 +756,7 @@ def test_sequence_get_data_values_from_list_data(monkeypatch):
     ]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -519,7 +774,7 @@ def test_sequence_get_data_values_from_non_standard_type(monkeypatch):
     payload = [{"id": "M0001 N0001", "link": []}]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -534,7 +789,7 @@ def test_sequence_get_data_values_with_unconvertible_list_tokens(monkeypatch):
     payload = [{"id": "M0001 N0001", "link": []}]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -566,6 +821,14 @@ def test_parse_data_values_skips_unconvertible_tokens():
     assert result == [1, 5]
 
 
+def test_parse_data_values_with_string_input():
+    """Parse comma-separated strings, falling back to tokenizing odd ones."""
+    big = "123456789012345678901234567890"
+    assert Sequence._parse_data_values(f"-1,0, 1,{big}") == [-1, 0, 1, int(big)]
+    assert Sequence._parse_data_values("1 2,3;x") == [1, 2, 3]
+    assert Sequence._parse_data_values("") == []
+
+
 # ---- Tests for _parse_authors (lines 324, 328) ----
 
 
@@ -590,6 +853,11 @@ def test_parse_offset_with_list_input():
     assert result == [0, 2]
 
 
+def test_parse_offset_rejects_signs_alone_and_non_ascii_digits():
+    """Skip bare signs and non-ASCII digit tokens, keep signed integers."""
+    assert Sequence._parse_offset("+2,-,\u0663,-1") == [2, -1]
+
+
 def test_parse_offset_with_non_standard_input():
     """Return empty list for non-str, non-list input."""
     assert Sequence._parse_offset(None) == []
@@ -605,6 +873,14 @@ def test_parse_keywords_with_list_input():
     assert result == ["nonn", "easy"]
 
 
+def test_parse_keywords_interns_tags():
+    """Share one string object per keyword tag across parsed sequences."""
+    first = Sequence._parse_keywords("nonn,easy")
+    second = Sequence._parse_keywords(" nonn , easy ")
+    assert first == second == ["nonn", "easy"]
+    assert all(a is b for a, b in zip(first, second))
+
+
 def test_parse_keywords_with_non_standard_input():
     """Return empty list for non-str, non-list input."""
     assert Sequence._parse_keywords(None) == []
@@ -624,7 +900,7 @@ def test_sequence_get_graph_image_returns_ipython_image_when_available(monkeypat
             return DummyResponse(payload)
         return DummyBinaryResponse(png_bytes)
 
-    monkeypatch.setattr("oeis_tools.sequence.requests.get", fake_get)
+    monkeypatch.setattr("oeis_tools.sequence.SESSION.get", fake_get)
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
 
     seq = Sequence("A000001")
@@ -651,7 +927,7 @@ def test_sequence_get_bibtex_includes_authors_date_url_and_title(monkeypatch):
     ]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -678,7 +954,7 @@ def test_sequence_get_bibtex_falls_back_without_authors_or_created_date(monkeypa
     payload = [{"id": "M0001 N0001", "link": []}]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -703,7 +979,7 @@ def test_sequence_get_data_values_parses_string_data_directly(monkeypatch):
     payload = [{"id": "M0001 N0001", "link": []}]
 
     monkeypatch.setattr(
-        "oeis_tools.sequence.requests.get",
+        "oeis_tools.sequence.SESSION.get",
         lambda url, timeout: DummyResponse(payload),
     )
     monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
@@ -712,3 +988,101 @@ def test_sequence_get_data_values_parses_string_data_directly(monkeypatch):
     # Manually set data to a raw string (as if __init__ didn't parse it)
     seq.data = "1,2,3,5,8,13"
     assert seq.get_data_values() == [1, 2, 3, 5, 8, 13]
+
+
+@pytest.mark.skipif(
+    not hasattr(sys, "get_int_max_str_digits"),
+    reason="int() has no digit limit on this Python version",
+)
+def test_parse_data_values_skips_tokens_past_the_int_digit_limit():
+    """Skip a term too long for ``int()`` instead of raising ``ValueError``."""
+    too_long = "9" * (sys.get_int_max_str_digits() + 1)
+    assert Sequence._parse_data_values(f"1,2,{too_long}") == [1, 2]
+    assert Sequence._parse_data_values(f"1, 2, ..., {too_long}") == [1, 2]
+
+
+# ---- Tests for bulk_fetch ----
+
+
+def test_sequence_bulk_fetch_batches_ids_and_keeps_order(monkeypatch):
+    """Fetch IDs ten at a time and return sequences in request order."""
+    ids = [f"A{number:06d}" for number in range(1, 13)]
+    urls = []
+
+    def fake_get(url, timeout):
+        urls.append(url)
+        query = url.split("q=", 1)[1].split("&", 1)[0]
+        records = [
+            {"number": int(term[4:]), "name": f"Sequence {term[3:]}", "link": []}
+            for term in reversed(query.split("|"))
+        ]
+        return DummyResponse(records)
+
+    monkeypatch.setattr("oeis_tools.sequence.SESSION.get", fake_get)
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    sequences = Sequence.bulk_fetch(ids)
+
+    assert len(urls) == 2
+    assert urls[0].count("id:") == 10
+    assert urls[1] == "https://oeis.org/search?q=id:A000011|id:A000012&fmt=json"
+    assert [seq.id for seq in sequences] == ids
+    assert sequences[0].name == "Sequence A000001"
+    assert sequences[-1].name == "Sequence A000012"
+
+
+def test_sequence_bulk_fetch_gives_repeated_ids_their_own_record(monkeypatch):
+    """Fetch a repeated ID once but never share its record between objects."""
+    urls = []
+
+    def fake_get(url, timeout):
+        urls.append(url)
+        return DummyResponse([{"number": 45, "name": "Fibonacci", "link": []}])
+
+    monkeypatch.setattr("oeis_tools.sequence.SESSION.get", fake_get)
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    first, second = Sequence.bulk_fetch(["A000045", "A000045"])
+    first.json["name"] = "mutated"
+
+    assert urls == ["https://oeis.org/search?q=id:A000045&fmt=json"]
+    assert second.json is not first.json
+    assert second.json["name"] == "Fibonacci"
+
+
+def test_sequence_bulk_fetch_can_prefetch_bfiles(monkeypatch):
+    """Start each b-file download when ``prefetch_bfiles`` is requested."""
+    created = []
+    monkeypatch.setattr(CountingBFile, "created", created)
+
+    monkeypatch.setattr(
+        "oeis_tools.sequence.SESSION.get",
+        lambda url, timeout: DummyResponse(
+            [{"number": 45, "link": []}, {"number": 40, "link": []}]
+        ),
+    )
+    monkeypatch.setattr("oeis_tools.sequence.BFile", CountingBFile)
+
+    fib, primes = Sequence.bulk_fetch(["A000045", "A000040"], prefetch_bfiles=True)
+
+    assert fib.bfile.oeis_id == "A000045"
+    assert primes.bfile.oeis_id == "A000040"
+    assert sorted(created) == ["A000040", "A000045"]
+
+
+def test_sequence_bulk_fetch_raises_for_missing_record(monkeypatch):
+    """Raise ``ValueError`` when OEIS returns no record for an ID."""
+    monkeypatch.setattr(
+        "oeis_tools.sequence.SESSION.get",
+        lambda url, timeout: DummyResponse([{"number": 45, "link": []}]),
+    )
+    monkeypatch.setattr("oeis_tools.sequence.BFile", DummyBFile)
+
+    with pytest.raises(ValueError, match="OEIS ID not found: A000001"):
+        Sequence.bulk_fetch(["A000045", "A000001"])
+
+
+def test_sequence_bulk_fetch_rejects_invalid_oeis_id():
+    """Validate every ID before issuing any request."""
+    with pytest.raises(ValueError, match="Invalid OEIS ID"):
+        Sequence.bulk_fetch(["A000045", "bad"])
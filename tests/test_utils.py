@@ -6,6 +6,8 @@
 import pytest
 
 from oeis_tools.utils import (
+    OEIS_KEYWORD_DESCRIPTIONS,
+    OEIS_KEYWORD_TAGS,
     OEIS_URL,
     check_id,
     oeis_bfile,
@@ -27,6 +29,13 @@ def test_check_id_rejects_invalid_oeis_ids():
     assert check_id("A12ABC") is False
 
 
+def test_check_id_rejects_non_ascii_digits():
+    """Reject Unicode digits that ``str.isdigit`` alone would accept."""
+    assert check_id("A\u0661\u0662\u0663\u0664\u0665\u0666") is False
+    assert check_id("A00000\u00b2") is False
+    assert check_id("A\uff10\uff10\uff10\uff10\uff10\uff11") is False
+
+
 def test_check_id_rejects_non_string_values():
     """Reject non-string inputs instead of raising type errors."""
     assert check_id(None) is False
@@ -44,6 +53,14 @@ def test_oeis_bfile_raises_for_invalid_id():
         oeis_bfile("A123")
 
 
+def test_oeis_bfile_and_url_raise_value_error_for_unhashable_input():
+    """Reject non-string IDs such as lists with ``ValueError``."""
+    with pytest.raises(ValueError, match="Invalid OEIS ID"):
+        oeis_bfile(["A000045"])
+    with pytest.raises(ValueError, match="Invalid OEIS ID"):
+        oeis_url(["A000045"], fmt="json")
+
+
 def test_oeis_url_builds_supported_formats():
     """Generate valid OEIS URLs for default and known formats."""
     assert oeis_url("A000001") == f"{OEIS_URL}/A000001"
@@ -65,6 +82,13 @@ def test_oeis_url_falls_back_to_default_for_unknown_format():
     assert oeis_url("A000001", fmt="unknown") == f"{OEIS_URL}/A000001"
 
 
+def test_oeis_url_raises_for_invalid_id():
+    """Raise ``ValueError`` for malformed IDs in every format."""
+    for fmt in (None, "json", "bfile"):
+        with pytest.raises(ValueError, match="Invalid OEIS ID"):
+            oeis_url("A123", fmt=fmt)
+
+
 def test_oeis_keyword_description_returns_expected_description():
     """Return wiki description text for a known OEIS keyword tag."""
     assert oeis_keyword_description("nonn") == (
@@ -81,6 +105,24 @@ def test_oeis_keyword_description_normalizes_and_handles_unknown():
     assert oeis_keyword_description("") is None
 
 
+def test_oeis_keyword_description_normalizes_non_string_tags():
+    """Resolve non-str tags through ``str()`` before normalizing them."""
+
+    class Tag:
+        def __str__(self):
+            return " NONN "
+
+    assert oeis_keyword_description(Tag()) == OEIS_KEYWORD_DESCRIPTIONS["nonn"]
+    assert oeis_keyword_description(42) is None
+
+
 def test_oeis_keyword_description_returns_none_for_none_input():
     """Return None when keyword_tag is None."""
     assert oeis_keyword_description(None) is None
+
+
+def test_oeis_keyword_tags_match_descriptions():
+    """Expose every described keyword tag as a frozenset for validation."""
+    assert isinstance(OEIS_KEYWORD_TAGS, frozenset)
+    assert OEIS_KEYWORD_TAGS == set(OEIS_KEYWORD_DESCRIPTIONS)
+    assert "nonn" in OEIS_KEYWORD_TAGS